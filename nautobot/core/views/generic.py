@@ -1155,12 +1155,15 @@ class BulkRenameView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
                 try:
                     with transaction.atomic():
                         renamed_pks = []
+                        find = form.cleaned_data["find"]
+                        replace = form.cleaned_data["replace"]
+                        use_regex = form.cleaned_data["use_regex"]
+                        if use_regex:
+                            find_compiled = form.cleaned_data["find_compiled"]
                         for obj in selected_objects:
-                            find = form.cleaned_data["find"]
-                            replace = form.cleaned_data["replace"]
-                            if form.cleaned_data["use_regex"]:
+                            if use_regex:
                                 try:
-                                    obj.new_name = re.sub(find, replace, obj.name)
+                                    obj.new_name = find_compiled.sub(replace, obj.name)
                                 # Catch regex group reference errors
                                 except re.error:
                                     obj.new_name = obj.name
@@ -6,12 +6,20 @@ import yaml
 from django import forms
 from django.forms import formset_factory
 from django.urls import reverse
+from django.utils.functional import cached_property
 
 from nautobot.ipam.formfields import IPNetworkFormField
 from nautobot.utilities.utils import (
     build_lookup_label,
     get_filterset_parameter_form_field,
 )
+from .utils import add_blank_choice
+
+# Prefer the libyaml C bindings when available, falling back to the pure-Python loader
+try:
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:
+    from yaml import SafeLoader as SafeYamlLoader
 
 __all__ = (
     "AddressFieldMixin",
@@ -30,6 +38,25 @@ __all__ = (
 
 logger = logging.getLogger(__name__)
 
+# Widgets which BootstrapMixin should not apply the "form-control" CSS class to
+BOOTSTRAP_EXEMPT_WIDGETS = frozenset(
+    (
+        forms.CheckboxInput,
+        forms.ClearableFileInput,
+        forms.FileInput,
+        forms.RadioSelect,
+    )
+)
+
+# Matches a YAML document start marker ("---") at the beginning of a line
+YAML_DOCUMENT_START_RE = re.compile(r"^---(?:\s|$)", re.MULTILINE)
+
+# Matches any blank, comment or directive (e.g. "%YAML 1.1") lines which may precede the first YAML document
+YAML_PREAMBLE_RE = re.compile(r"(?:[ \t]*(?:[#%][^\n]*)?\n)*")
+
+# Constant query param passed to the lookup_type select widget of DynamicFilterForm
+LOOKUP_FIELD_QUERY_PARAM = json.dumps(["$lookup_field"])
+
 
 class AddressFieldMixin(forms.ModelForm):
     """
@@ -41,15 +68,14 @@ class AddressFieldMixin(forms.ModelForm):
     def __init__(self, *args, **kwargs):
 
         instance = kwargs.get("instance")
-        initial = kwargs.get("initial", {}).copy()
+        initial = kwargs.get("initial") or {}
 
         # If initial already has an `address`, we want to use that `address` as it was passed into
         # the form. If we're editing an object with a `address` field, we need to patch initial
         # to include `address` because it is a computed field.
+        # `initial` is only copied when it actually needs to be patched.
         if "address" not in initial and instance is not None:
-            initial["address"] = instance.address
-
-        kwargs["initial"] = initial
+            kwargs["initial"] = {**initial, "address": instance.address}
 
         super().__init__(*args, **kwargs)
 
@@ -68,17 +94,10 @@ class BootstrapMixin(forms.BaseForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        exempt_widgets = [
-            forms.CheckboxInput,
-            forms.ClearableFileInput,
-            forms.FileInput,
-            forms.RadioSelect,
-        ]
-
         for field in self.fields.values():
-            if field.widget.__class__ not in exempt_widgets:
+            if field.widget.__class__ not in BOOTSTRAP_EXEMPT_WIDGETS:
                 css = field.widget.attrs.get("class", "")
-                field.widget.attrs["class"] = " ".join([css, "form-control"]).strip()
+                field.widget.attrs["class"] = f"{css} form-control" if css else "form-control"
             if field.required and not isinstance(field.widget, forms.FileInput):
                 field.widget.attrs["required"] = "required"
             if "placeholder" not in field.widget.attrs:
@@ -112,11 +131,9 @@ class BulkEditForm(forms.Form):
     def __init__(self, model, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.model = model
-        self.nullable_fields = []
 
-        # Copy any nullable fields defined in Meta
-        if hasattr(self.Meta, "nullable_fields"):
-            self.nullable_fields = self.Meta.nullable_fields
+        # Copy any nullable fields defined in Meta. This must be a per-instance copy since subclasses append to it.
+        self.nullable_fields = list(getattr(self.Meta, "nullable_fields", ()))
 
 
 class BulkRenameForm(forms.Form):
@@ -131,10 +148,10 @@ class BulkRenameForm(forms.Form):
     def clean(self):
         super().clean()
 
-        # Validate regular expression in "find" field
+        # Validate regular expression in "find" field, keeping the compiled pattern for reuse
         if self.cleaned_data["use_regex"]:
             try:
-                re.compile(self.cleaned_data["find"])
+                self.cleaned_data["find_compiled"] = re.compile(self.cleaned_data["find"])
             except re.error:
                 raise forms.ValidationError({"find": "Invalid regular expression"})
 
@@ -164,15 +181,14 @@ class PrefixFieldMixin(forms.ModelForm):
     def __init__(self, *args, **kwargs):
 
         instance = kwargs.get("instance")
-        initial = kwargs.get("initial", {}).copy()
+        initial = kwargs.get("initial") or {}
 
         # If initial already has a `prefix`, we want to use that `prefix` as it was passed into
         # the form. If we're editing an object with a `prefix` field, we need to patch initial
         # to include `prefix` because it is a computed field.
+        # `initial` is only copied when it actually needs to be patched.
         if "prefix" not in initial and instance is not None:
-            initial["prefix"] = instance.prefix
-
-        kwargs["initial"] = initial
+            kwargs["initial"] = {**initial, "prefix": instance.prefix}
 
         super().__init__(*args, **kwargs)
 
@@ -195,11 +211,45 @@ class ImportForm(BootstrapMixin, forms.Form):
     )
     format = forms.ChoiceField(choices=(("json", "JSON"), ("yaml", "YAML")), initial="yaml")
 
+    @staticmethod
+    def _parse_yaml_compatible_float(value):
+        """
+        `json.loads()` float hook which rejects exponent notation, since PyYAML (YAML 1.1) loads e.g. `1e5` as a string.
+        """
+        if "e" in value or "E" in value:
+            raise ValueError(f"{value} must be parsed as YAML")
+        return float(value)
+
+    @staticmethod
+    def _reject_json_constant(value):
+        """
+        `json.loads()` constant hook which rejects `NaN`/`Infinity`/`-Infinity`, since PyYAML loads these as strings.
+        """
+        raise ValueError(f"{value} must be parsed as YAML")
+
+    @staticmethod
+    def _has_multiple_yaml_documents(data):
+        """
+        Return True if `data` contains a YAML document start marker other than one which starts the first document.
+
+        Only the first MB is probed here; beyond that the YAML loader itself rejects multi-document streams, so we avoid
+        an extra full pass over large single documents.
+        """
+        match = YAML_DOCUMENT_START_RE.search(data, 0, 1_048_576)
+        if match and YAML_PREAMBLE_RE.fullmatch(data, 0, match.start()):
+            # This marker only starts the first document, preceded by nothing but blank, comment or directive lines
+            match = YAML_DOCUMENT_START_RE.search(data, match.end(), 1_048_576)
+        return match is not None
+
     def clean(self):
         super().clean()
 
-        data = self.cleaned_data["data"]
-        format_ = self.cleaned_data["format"]
+        data = self.cleaned_data.get("data")
+        format_ = self.cleaned_data.get("format")
+
+        # Empty or whitespace-only data has already failed field validation, so don't bother parsing it
+        if not data or not format_:
+            return
 
         # Process JSON/YAML data
         if format_ == "json":
@@ -212,12 +262,20 @@ class ImportForm(BootstrapMixin, forms.Form):
                 raise forms.ValidationError({"data": f"Invalid JSON data: {err}"})
         else:
             # Check for multiple YAML documents
-            if "\n---" in data:
+            if self._has_multiple_yaml_documents(data):
                 raise forms.ValidationError({"data": "Import is limited to one object at a time."})
+            # Most JSON input is also valid YAML 1.1 with the same meaning, so try the much faster JSON parser first and
+            # only fall back to YAML. Exponent floats and NaN/Infinity are loaded differently by PyYAML (as strings),
+            # so those are rejected by the JSON parser and left to YAML.
             try:
-                self.cleaned_data["data"] = yaml.load(data, Loader=yaml.SafeLoader)
-            except yaml.error.YAMLError as err:
-                raise forms.ValidationError({"data": f"Invalid YAML data: {err}"})
+                self.cleaned_data["data"] = json.loads(
+                    data, parse_float=self._parse_yaml_compatible_float, parse_constant=self._reject_json_constant
+                )
+            except ValueError:
+                try:
+                    self.cleaned_data["data"] = yaml.load(data, Loader=SafeYamlLoader)
+                except yaml.error.YAMLError as err:
+                    raise forms.ValidationError({"data": f"Invalid YAML data: {err}"})
 
 
 class TableConfigForm(BootstrapMixin, forms.Form):
@@ -252,12 +310,12 @@ class DynamicFilterForm(BootstrapMixin, forms.Form):
     """
 
     lookup_field = forms.ChoiceField(
-        choices=[],
+        choices=(),
         required=False,
         label="Field",
     )
     lookup_type = forms.ChoiceField(
-        choices=[],
+        choices=(),
         required=False,
     )
     lookup_value = forms.CharField(
@@ -265,9 +323,8 @@ class DynamicFilterForm(BootstrapMixin, forms.Form):
         label="Value",
     )
 
-    def __init__(self, *args, filterset_class=None, **kwargs):
+    def __init__(self, *args, filterset_class=None, filterset=None, lookup_field_choices=None, **kwargs):
         super().__init__(*args, **kwargs)
-        from nautobot.utilities.forms import add_blank_choice  # Avoid circular import
 
         # cls.model is set at `dynamic_formset_factory()`
         self.filterset_class = filterset_class or getattr(self, "filterset_class", None)
@@ -279,12 +336,17 @@ class DynamicFilterForm(BootstrapMixin, forms.Form):
         model = self.filterset_class._meta.model
 
         if self.filterset_class is not None:
-            filterset_class = self.filterset_class()
-            self.filterset_filters = filterset_class.filters
-            contenttype = model._meta.app_label + "." + model._meta.model_name
+            # A FilterSet instance may be shared by the parent formset, see `BaseDynamicFilterFormSet`
+            if filterset is None:
+                filterset = self.filterset_class()
+            self.filterset_filters = filterset_filters = filterset.filters
+            meta = model._meta
+            contenttype = f"{meta.app_label}.{meta.model_name}"
 
             # Configure fields: Add css class and set choices for lookup_field
-            self.fields["lookup_field"].choices = add_blank_choice(self._get_lookup_field_choices())
+            if lookup_field_choices is None:
+                lookup_field_choices = add_blank_choice(self._get_lookup_field_choices())
+            self.fields["lookup_field"].choices = lookup_field_choices
             self.fields["lookup_field"].widget.attrs["class"] = "nautobot-select2-static lookup_field-select"
 
             # Update lookup_type and lookup_value fields to match expected field types derived from data
@@ -292,46 +354,79 @@ class DynamicFilterForm(BootstrapMixin, forms.Form):
             if "data" in kwargs and "prefix" in kwargs:
                 data = kwargs["data"]
                 prefix = kwargs["prefix"]
-                lookup_type = data.get(prefix + "-lookup_type")
-                lookup_value = data.getlist(prefix + "-lookup_value")
+                lookup_type = data.get(f"{prefix}-lookup_type")
+                lookup_value = data.getlist(f"{prefix}-lookup_value") if lookup_type else None
 
-                if lookup_type and lookup_value and lookup_type in self.filterset_filters:
-                    verbose_name = self.filterset_filters[lookup_type].lookup_expr
+                if lookup_type and lookup_value and lookup_type in filterset_filters:
+                    verbose_name = filterset_filters[lookup_type].lookup_expr
                     label = build_lookup_label(lookup_type, verbose_name)
                     self.fields["lookup_type"].choices = [(lookup_type, label)]
-                    self.fields["lookup_value"] = get_filterset_parameter_form_field(model, lookup_type)
-                elif lookup_type and lookup_type not in self.filterset_filters:
-                    logger.warning(f"{lookup_type} is not a valid {filterset_class.__class__.__name__} field")
-
-            self.fields["lookup_type"].widget.attrs["data-query-param-field_name"] = json.dumps(["$lookup_field"])
-            self.fields["lookup_type"].widget.attrs["data-contenttype"] = contenttype
-            self.fields["lookup_type"].widget.attrs["data-url"] = reverse("core-api:filtersetfield-list-lookupchoices")
-            self.fields["lookup_type"].widget.attrs["class"] = "nautobot-select2-api lookup_type-select"
-
-            lookup_value_css = self.fields["lookup_value"].widget.attrs.get("class") or ""
-            self.fields["lookup_value"].widget.attrs["class"] = " ".join(
-                [lookup_value_css, "lookup_value-input form-control"]
-            )
+                    self.fields["lookup_value"] = get_filterset_parameter_form_field(
+                        model, lookup_type, filterset=filterset
+                    )
+                elif lookup_type and lookup_type not in filterset_filters:
+                    logger.warning(f"{lookup_type} is not a valid {filterset.__class__.__name__} field")
+
+            lookup_type_attrs = self.fields["lookup_type"].widget.attrs
+            lookup_type_attrs["data-query-param-field_name"] = LOOKUP_FIELD_QUERY_PARAM
+            lookup_type_attrs["data-contenttype"] = contenttype
+            lookup_type_attrs["data-url"] = reverse("core-api:filtersetfield-list-lookupchoices")
+            lookup_type_attrs["class"] = "nautobot-select2-api lookup_type-select"
+
+            lookup_value_attrs = self.fields["lookup_value"].widget.attrs
+            lookup_value_css = lookup_value_attrs.get("class") or ""
+            lookup_value_attrs["class"] = f"{lookup_value_css} lookup_value-input form-control"
         else:
             logger.warning(f"FilterSet for {model.__class__} not found.")
 
     @staticmethod
     def capitalize(field):
         field = field.replace("_custom_field_data__", "")
-        split_field = field.split("__") if "__" in field else field.split("_")
-        words = " ".join(split_field)
-        return words[0].upper() + words[1:]
+        words = field.replace("__", " ") if "__" in field else field.replace("_", " ")
+        return words[:1].upper() + words[1:]
 
     def _get_lookup_field_choices(self):
         """Get choices for lookup_fields i.e filterset parameters without a lookup expr"""
+        return self._get_lookup_field_choices_from_filters(self.filterset_filters)
+
+    @classmethod
+    def _get_lookup_field_choices_from_filters(cls, filterset_filters):
         filterset_without_lookup = (
-            (name, field.label or self.capitalize(field.field_name))
-            for name, field in self.filterset_filters.items()
+            (name, field.label or cls.capitalize(field.field_name))
+            for name, field in filterset_filters.items()
             if "__" not in name and name != "q"
         )
         return sorted(filterset_without_lookup)
 
 
+class BaseDynamicFilterFormSet(forms.BaseFormSet):
+    """
+    Formset for DynamicFilterForm which instantiates the FilterSet and builds the lookup_field choices once,
+    sharing them across all of its forms.
+    """
+
+    # filterset_class is set at `dynamic_formset_factory()`
+    filterset_class = None
+
+    @cached_property
+    def filterset(self):
+        return (self.filterset_class or self.form.filterset_class)()
+
+    @cached_property
+    def lookup_field_choices(self):
+        return add_blank_choice(self.form._get_lookup_field_choices_from_filters(self.filterset.filters))
+
+    def get_form_kwargs(self, index):
+        kwargs = super().get_form_kwargs(index)
+        # `filterset_class` is passed as well so that each form's model comes from the same FilterSet class as the
+        # shared `filterset`, rather than from the process-wide `DynamicFilterForm.filterset_class` which
+        # `dynamic_formset_factory()` overwrites on every call.
+        kwargs.setdefault("filterset_class", self.filterset.__class__)
+        kwargs.setdefault("filterset", self.filterset)
+        kwargs.setdefault("lookup_field_choices", self.lookup_field_choices)
+        return kwargs
+
+
 def dynamic_formset_factory(filterset_class, data=None, **kwargs):
     filter_form = DynamicFilterForm
     filter_form.filterset_class = filterset_class
@@ -342,7 +437,8 @@ def dynamic_formset_factory(filterset_class, data=None, **kwargs):
         "extra": 3,
     }
     kwargs.update(params)
-    form = formset_factory(form=filter_form, **kwargs)
+    form = formset_factory(form=filter_form, formset=BaseDynamicFilterFormSet, **kwargs)
+    form.filterset_class = filterset_class
     if data:
         form = form(data=data)
 
@@ -8,8 +8,10 @@ from unittest import mock
 from netaddr import IPNetwork
 
 from nautobot.dcim.filters import SiteFilterSet
-from nautobot.dcim.models import Device
+from nautobot.dcim.forms import SiteBulkEditForm
+from nautobot.dcim.models import Device, Site
 from nautobot.dcim.tests.test_views import create_test_device
+from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.filters import StatusFilterSet
 from nautobot.extras.models import CustomField
 from nautobot.ipam.forms import IPAddressCSVForm, ServiceForm, ServiceFilterForm
@@ -28,7 +30,13 @@ from nautobot.utilities.forms.utils import (
     add_field_to_filter_form_class,
 )
 from nautobot.utilities.forms.widgets import APISelect, APISelectMultiple, DatePicker, StaticSelect2
-from nautobot.utilities.forms.forms import AddressFieldMixin, DynamicFilterForm, PrefixFieldMixin
+from nautobot.utilities.forms.forms import (
+    AddressFieldMixin,
+    DynamicFilterForm,
+    DynamicFilterFormSet,
+    ImportForm,
+    PrefixFieldMixin,
+)
 from nautobot.utilities.testing import TestCase as NautobotTestCase
 from nautobot.utilities.utils import convert_querydict_to_factory_formset_acceptable_querydict
 
@@ -599,6 +607,27 @@ class PrefixFieldMixinTest(TestCase):
             mock_init.assert_called_with(initial=self.initial, instance=self.prefix)
 
 
+class BulkEditFormTest(TestCase):
+    """Test cases for the BulkEditForm."""
+
+    def test_nullable_fields_not_shared(self):
+        """Ensure instances get their own nullable_fields list and don't modify the one defined in Meta."""
+        custom_field = CustomField.objects.create(
+            name="Bulk Edit Field", slug="bulk_edit_field", type=CustomFieldTypeChoices.TYPE_TEXT, required=False
+        )
+        custom_field.content_types.set([ContentType.objects.get_for_model(Site)])
+        meta_nullable_fields = list(SiteBulkEditForm.Meta.nullable_fields)
+
+        form_1 = SiteBulkEditForm(Site)
+        form_2 = SiteBulkEditForm(Site)
+
+        self.assertEqual(SiteBulkEditForm.Meta.nullable_fields, meta_nullable_fields)
+        self.assertIsNot(form_1.nullable_fields, form_2.nullable_fields)
+        self.assertIsNot(form_1.nullable_fields, SiteBulkEditForm.Meta.nullable_fields)
+        self.assertEqual(form_1.nullable_fields.count("cf_bulk_edit_field"), 1)
+        self.assertEqual(form_2.nullable_fields.count("cf_bulk_edit_field"), 1)
+
+
 class JSONFieldTest(NautobotTestCase):
     def test_no_exception_raised(self):
         """
@@ -895,3 +924,77 @@ class DynamicFilterFormTest(TestCase):
                 },
             )
             self.assertIsInstance(form.fields["lookup_value"], forms.IntegerField)
+
+    def test_dynamic_filter_formset_shares_filterset(self):
+        """Assert that all forms in a dynamic filter formset share a single FilterSet instance."""
+        formset = DynamicFilterFormSet(filterset_class=SiteFilterSet)()
+        filterset_filters = [form.filterset_filters for form in formset.forms]
+        self.assertEqual(len(filterset_filters), 3)
+        for filters in filterset_filters:
+            self.assertIs(filters, formset.filterset.filters)
+        self.assertIs(formset.empty_form.filterset_filters, formset.filterset.filters)
+
+        for form in formset.forms:
+            self.assertEqual(form.fields["lookup_field"].choices, list(formset.lookup_field_choices))
+
+        # Forms must not pick up a different filterset_class set on DynamicFilterForm by a later factory call
+        site_formset = DynamicFilterFormSet(filterset_class=SiteFilterSet)()
+        DynamicFilterFormSet(filterset_class=StatusFilterSet)
+        for form in site_formset.forms:
+            self.assertIs(form.filterset_class, SiteFilterSet)
+            self.assertEqual(form.fields["lookup_type"].widget.attrs["data-contenttype"], "dcim.site")
+
+
+class ImportFormTest(TestCase):
+    def test_yaml_data(self):
+        form = ImportForm(data={"data": "---\nname: Site 1\nslug: site-1\n", "format": "yaml"})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["data"], {"name": "Site 1", "slug": "site-1"})
+
+    def test_json_data_with_yaml_format(self):
+        form = ImportForm(data={"data": '{"name": "Site 1", "slug": "site-1"}', "format": "yaml"})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["data"], {"name": "Site 1", "slug": "site-1"})
+
+    def test_json_data_with_yaml_format_matches_yaml_loading(self):
+        """JSON values which PyYAML loads differently than json.loads() must still be loaded as YAML."""
+        for data, expected in (
+            ('{"a": 1e5}', {"a": "1e5"}),
+            ('{"a": 1.5E+5}', {"a": 150000.0}),
+            ('{"a": 1.5}', {"a": 1.5}),
+            ('{"a": NaN}', {"a": "NaN"}),
+            ('{"a": -Infinity}', {"a": "-Infinity"}),
+        ):
+            with self.subTest(data=data):
+                form = ImportForm(data={"data": data, "format": "yaml"})
+                self.assertTrue(form.is_valid())
+                self.assertEqual(form.cleaned_data["data"], expected)
+
+    def test_multiple_yaml_documents(self):
+        for data in (
+            "name: Site 1\n---\nname: Site 2\n",
+            "---\nname: Site 1\n---\nname: Site 2\n",
+            "# Sites\n---\nname: Site 1\n--- # Another site\nname: Site 2\n",
+        ):
+            with self.subTest(data=data):
+                form = ImportForm(data={"data": data, "format": "yaml"})
+                self.assertFalse(form.is_valid())
+                self.assertEqual(form.errors["data"], ["Import is limited to one object at a time."])
+
+    def test_yaml_document_start_after_comments_and_directives(self):
+        for data in (
+            "# Site\n---\nname: Site 1\n",
+            "%YAML 1.1\n---\nname: Site 1\n",
+            "\n# Site\n\n---\nname: Site 1\n",
+        ):
+            with self.subTest(data=data):
+                form = ImportForm(data={"data": data, "format": "yaml"})
+                self.assertTrue(form.is_valid())
+                self.assertEqual(form.cleaned_data["data"], {"name": "Site 1"})
+
+    def test_empty_data(self):
+        for data in ("", "  \n "):
+            for format_ in ("json", "yaml"):
+                form = ImportForm(data={"data": data, "format": format_})
+                self.assertFalse(form.is_valid())
+                self.assertEqual(form.errors["data"], ["This field is required."])
@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 from django.db.models import Q
 from django.http import QueryDict
 from django.test import TestCase
+from unittest import mock
 
 from nautobot.core.settings_funcs import is_truthy
 from nautobot.extras.models import JobHook, Status, Tag
@@ -439,6 +440,13 @@ class LookupRelatedFunctionTest(TestCase):
                 get_filterset_field(SiteFilterSet, "unknown")
             self.assertEqual(str(err.exception), "unknown is not a valid SiteFilterSet field")
 
+        with self.subTest("Test with an already instantiated filterset"):
+            filterset = SiteFilterSet()
+            self.assertIs(get_filterset_field(filterset, "name"), filterset.filters["name"])
+            with self.assertRaises(FilterSetFieldNotFound) as err:
+                get_filterset_field(filterset, "unknown")
+            self.assertEqual(str(err.exception), "unknown is not a valid SiteFilterSet field")
+
     def test_get_filterset_parameter_form_field(self):
         with self.subTest("Test get CharFields"):
             site_fields = ["comments", "name", "contact_email", "physical_address", "shipping_address"]
@@ -501,6 +509,30 @@ class LookupRelatedFunctionTest(TestCase):
                 get_filterset_parameter_form_field(Site, "unknown")
             self.assertEqual(str(err.exception), "unknown is not a valid SiteFilterSet field")
 
+        with self.subTest("Test with an already instantiated filterset"):
+            filterset = SiteFilterSet()
+            filters = filterset.filters
+            created_filter = filters["created"]
+            form_field = get_filterset_parameter_form_field(Site, "created", filterset=filterset)
+            self.assertIsInstance(form_field.widget, DatePicker)
+            # Only the form field is copied; the shared filter and its widget are left untouched
+            self.assertIsNot(form_field, created_filter.field)
+            self.assertIsNot(form_field.widget, created_filter.field.widget)
+            self.assertNotIsInstance(created_filter.field.widget, DatePicker)
+            self.assertIs(filterset.filters, filters)
+            self.assertIs(filterset.filters["created"], created_filter)
+            self.assertIs(created_filter.parent, filterset)
+
+            # Form fields which are replaced outright don't need the shared filter's form field to be copied
+            with mock.patch("nautobot.utilities.utils.copy") as mock_copy:
+                form_field = get_filterset_parameter_form_field(Site, "asn", filterset=filterset)
+                self.assertIsInstance(form_field, forms.IntegerField)
+                mock_copy.deepcopy.assert_not_called()
+
+            with self.assertRaises(FilterSetFieldNotFound) as err:
+                get_filterset_parameter_form_field(Site, "unknown", filterset=filterset)
+            self.assertEqual(str(err.exception), "unknown is not a valid SiteFilterSet field")
+
         with self.subTest("Test Content types"):
             form_field = get_filterset_parameter_form_field(Status, "content_types")
             self.assertIsInstance(form_field, MultipleContentTypeField)
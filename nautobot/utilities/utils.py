@@ -5,6 +5,7 @@ import json
 import re
 import uuid
 from collections import OrderedDict, namedtuple
+from functools import lru_cache
 from itertools import count, groupby
 from decimal import Decimal
 
@@ -743,10 +744,13 @@ def pretty_print_query(query):
     return pretty_str(query)
 
 
+@lru_cache(maxsize=512)
 def build_lookup_label(field_name, _verbose_name):
     """
     Return lookup expr with its verbose name
 
+    Results are memoized since the set of filterset field names and lookup exprs is small and fixed.
+
     Args:
         field_name (str): Field name e.g slug__iew
         _verbose_name (str): The verbose name for the lookup exper which is suffixed to the field name e.g iew -> iendswith
@@ -794,15 +798,24 @@ def get_all_lookup_expr_for_field(model, field_name):
 
 
 def get_filterset_field(filterset_class, field_name):
-    field = filterset_class().filters.get(field_name)
+    """
+    Return the `field_name` filter of `filterset_class`, which may be a FilterSet class or an instantiated FilterSet.
+    """
+    filterset = filterset_class() if inspect.isclass(filterset_class) else filterset_class
+    field = filterset.filters.get(field_name)
     if field is None:
-        raise FilterSetFieldNotFound(f"{field_name} is not a valid {filterset_class.__name__} field")
+        raise FilterSetFieldNotFound(f"{field_name} is not a valid {filterset.__class__.__name__} field")
     return field
 
 
-def get_filterset_parameter_form_field(model, parameter):
+def get_filterset_parameter_form_field(model, parameter, filterset=None):
     """
     Return the relevant form field instance for a filterset parameter e.g DynamicModelMultipleChoiceField, forms.IntegerField e.t.c
+
+    Args:
+        model: Model whose filterset `parameter` belongs to
+        parameter (str): Filterset parameter name e.g slug__iew
+        filterset (BaseFilterSet): Optional already-instantiated FilterSet for `model`, to avoid instantiating a new one
     """
     # Avoid circular import
     from nautobot.extras.filters import ContentTypeMultipleChoiceFilter, StatusFilter
@@ -819,9 +832,9 @@ def get_filterset_parameter_form_field(model, parameter):
         MultipleContentTypeField,
     )
 
-    filterset_class = get_filterset_for_model(model)
-    field = get_filterset_field(filterset_class, parameter)
+    field = get_filterset_field(filterset if filterset is not None else get_filterset_for_model(model), parameter)
     form_field = field.field
+    widget = None
 
     # TODO(Culver): We are having to replace some widgets here because multivalue_field_factory that generates these isn't smart enough
     if isinstance(field, NumberFilter):
@@ -862,11 +875,18 @@ def get_filterset_parameter_form_field(model, parameter):
 
         form_field = form_field_class(**form_attr)
     elif isinstance(field, DateTimeFilter):
-        form_field.widget = DateTimePicker()
+        widget = DateTimePicker()
     elif isinstance(field, DateFilter):
-        form_field.widget = DatePicker()
+        widget = DatePicker()
     elif isinstance(field, TimeFilter):
-        form_field.widget = TimePicker()
+        widget = TimePicker()
+
+    if filterset is not None and form_field is field.field:
+        # `form_field` belongs to the filter of the shared `filterset`, so copy it (and its widget) before modifying it.
+        # Copying the filter itself would also copy its `parent`, i.e. the entire FilterSet.
+        form_field = copy.deepcopy(form_field)
+    if widget is not None:
+        form_field.widget = widget
 
     form_field.required = False
     form_field.initial = None